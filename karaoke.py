@@ -7,7 +7,7 @@ Karaoke (CLI) — minimal, fast, no-frills.
 - Works best on macOS/Linux out of the box. On Windows, install "windows-curses".
 
 Usage:
-  python karaoke.py path/to/song.mp3 path/to/lyrics.lrc [--offset SECONDS] [--tempo 1.0] [--pitch 0]
+  python karaoke.py path/to/song.mp3 path/to/lyrics.lrc [--offset SECONDS] [--tempo 1.0] [--pitch 0] [--fps 10] [--buffered]
 
 Notes:
   • You must have FFmpeg (ffplay) in PATH. Get it from https://ffmpeg.org/
@@ -17,73 +17,157 @@ Notes:
 """
 
 import argparse
+import bisect
+import contextlib
 import curses
+import math
+import mmap
 import os
 import re
 import shlex
+import shutil
 import signal
 import subprocess
 import sys
 import time
-from dataclasses import dataclass
 from typing import List, Tuple
 
-TIMESTAMP = re.compile(r"\[(\d{2}):(\d{2})(?:\.(\d{1,2}))?\]")
-
-@dataclass
-class Line:
-    t: float  # seconds since start
-    text: str
-
-def parse_lrc(path: str) -> List[Line]:
-    lines: List[Line] = []
-    with open(path, "r", encoding="utf-8") as f:
-        for raw in f:
-            raw = raw.rstrip("\n")
-            stamps = list(TIMESTAMP.finditer(raw))
-            if not stamps:
-                continue
-            text = TIMESTAMP.sub("", raw).strip()
-            for m in stamps:
-                mm = int(m.group(1))
-                ss = int(m.group(2))
-                cc = m.group(3) or "0"
-                # Normalize centiseconds/milliseconds
-                if len(cc) == 1:
-                    frac = int(cc) / 10.0
-                else:
-                    frac = int(cc[:2]) / 100.0
-                t = mm * 60 + ss + frac
-                lines.append(Line(t=t, text=text))
-    lines.sort(key=lambda x: x.t)
-    return lines
+# Optional: libmpv (pip install python-mpv) exposes the player's own clock, so
+# lyrics can be slaved to the audio position instead of free-running on
+# perf_counter. Entirely optional — we fall back to ffplay without it.
+try:
+    import mpv
+except (ImportError, OSError):  # OSError: python-mpv installed but libmpv missing
+    mpv = None
+
+# Bytes-mode pattern: timestamps are pure ASCII, so stamps can be scanned
+# straight off the mmap'd file without decoding it first.
+TIMESTAMP = re.compile(rb"\[(\d{2}):(\d{2})(?:\.(\d{1,2}))?\]")
+
+# Fraction lookup tables so the parse loop never divides: deciseconds (one
+# digit after the dot) and centiseconds (two digits).
+DS_TABLE = [i / 10.0 for i in range(10)]
+CS_TABLE = [i / 100.0 for i in range(100)]
+
+# Display prefixes for the 5-line lyric window, indexed by rel + 2.
+PREFIXES = ("  ", "· ", "> ", "· ", "  ")
+
+# Resolve ffplay once at import instead of walking PATH on every launch.
+# None simply means the ffplay backend is unavailable (mpv may still work).
+FFPLAY = shutil.which("ffplay")
 
-def build_ffplay_cmd(audio: str, tempo: float, pitch_semitones: float) -> list:
+# Prebuilt bar segments: slicing these is a straight memcpy, cheaper than
+# rebuilding "#"*n + "-"*m every time the bar is formatted.
+FULL_BAR = "#" * 1024
+EMPTY_BAR = "-" * 1024
+
+def parse_lrc(path: str) -> Tuple[List[float], List[str]]:
+    # Struct-of-arrays layout: one flat list of start times (what the hot
+    # per-frame lookup scans) and one parallel list of texts, instead of a
+    # heap-scattered object per line.
+    entries: List[Tuple[float, str]] = []
+    with open(path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            data = f.read()  # empty file, or a source that can't be mmap'd
+        try:
+            # Scan the raw bytes line by line; stamps are matched without any
+            # decoding, and only lines that actually carry a stamp get their
+            # lyric text decoded. Metadata and blank lines cost one find().
+            pos = 0
+            end = len(data)
+            while pos < end:
+                nl = data.find(b"\n", pos)
+                if nl == -1:
+                    nl = end
+                line_start, line_end = pos, nl
+                pos = nl + 1
+                # Single regex pass: collect the stamps and the text slices
+                # between them in one walk.
+                stamps = []
+                pieces = []
+                prev_end = line_start
+                for m in TIMESTAMP.finditer(data, line_start, line_end):
+                    stamps.append(m.groups())
+                    pieces.append(data[prev_end:m.start()])
+                    prev_end = m.end()
+                if not stamps:
+                    continue
+                pieces.append(data[prev_end:line_end])
+                text = b"".join(pieces).decode("utf-8", "replace").strip()
+                for mm, ss, cc in stamps:
+                    # Normalize centiseconds/milliseconds via the lookup tables
+                    if cc is None:
+                        frac = 0.0
+                    elif len(cc) == 1:
+                        frac = DS_TABLE[int(cc)]
+                    else:
+                        frac = CS_TABLE[int(cc)]
+                    t = int(mm) * 60 + int(ss) + frac
+                    entries.append((t, text))
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+    entries.sort(key=lambda e: e[0])
+    return [e[0] for e in entries], [e[1] for e in entries]
+
+def atempo_chain(factor: float) -> List[str]:
+    # ffmpeg's atempo filter only accepts 0.5..2.0 per instance; factor an
+    # arbitrary ratio into a chain of in-range filters as ffmpeg documents.
+    # Passing an out-of-range value straight through makes ffplay exit with an
+    # error, which looks like a silent hang from inside the curses UI.
+    filters = []
+    t = factor
+    while t > 2.0:
+        filters.append("atempo=2.0")
+        t /= 2.0
+    while t < 0.5:
+        filters.append("atempo=0.5")
+        t /= 0.5
+    if abs(t - 1.0) > 1e-6:
+        filters.append(f"atempo={t:.6f}")
+    return filters
+
+def build_ffplay_cmd(audio: str, tempo: float, pitch_semitones: float, buffered: bool = False) -> list:
     # Compose audio filter chain. Tempo without pitch change is done with atempo (0.5..2.0 range per filter).
     # For modest pitch shifting, use asetrate + atempo trick (quality is ok for karaoke demos).
+    if not -24.0 <= pitch_semitones <= 24.0:
+        raise SystemExit("Pitch shift must be within ±24 semitones.")
+    if tempo <= 0:
+        raise SystemExit("Tempo must be positive.")
     afilters = []
     if abs(pitch_semitones) > 1e-6:
         # pitch shift by changing sample rate then atempo to restore tempo
         ratio = 2 ** (pitch_semitones / 12.0)
         afilters.append(f"asetrate=sr*{ratio}")
         # adjust tempo back so overall speed ~1.0 (may interact with user tempo below)
-        afilters.append(f"atempo={1/ratio:.6f}")
+        afilters += atempo_chain(1 / ratio)
     if abs(tempo - 1.0) > 1e-6:
-        # ffplay's atempo supports 0.5..2.0, chain if outside
-        # We'll clamp to safe range and warn in UI if out-of-range.
-        afilters.append(f"atempo={tempo:.6f}")
+        afilters += atempo_chain(tempo)
 
-    args = ["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet"]
+    args = [FFPLAY or "ffplay", "-nodisp", "-autoexit"]
+    if not buffered:
+        # Skip ffplay's ~1.5s probe/buffer phase; our lyric clock starts at
+        # Popen return, so that delay would otherwise become a built-in sync
+        # offset. --buffered restores the defaults for files where nobuffer
+        # clips the first few milliseconds.
+        args += ["-fflags", "nobuffer", "-flags", "low_delay", "-probesize", "32", "-analyzeduration", "0"]
+    args += ["-loglevel", "quiet"]
     if afilters:
         args += ["-af", ",".join(afilters)]
     args += [audio]
     return args
 
-def draw_progress(stdscr, now_s: float, total_s: float, width: int) -> None:
+def format_progress(now_s: float, total_s: float, width: int) -> str:
     width = max(10, width)
     frac = 0.0 if total_s <= 0 else min(1.0, max(0.0, now_s / total_s))
     filled = int(frac * (width - 2))
-    bar = "[" + "#" * filled + "-" * ((width - 2) - filled) + "]"
+    empty = (width - 2) - filled
+    if width - 2 <= len(FULL_BAR):
+        bar = "[" + FULL_BAR[:filled] + EMPTY_BAR[:empty] + "]"
+    else:  # absurdly wide terminal; fall back to building from scratch
+        bar = "[" + "#" * filled + "-" * empty + "]"
     mins = int(now_s // 60)
     secs = int(now_s % 60)
     tmins = int(total_s // 60)
@@ -93,95 +177,261 @@ def draw_progress(stdscr, now_s: float, total_s: float, width: int) -> None:
     if len(label) < len(bar) - 2:
         start = (len(bar) - len(label)) // 2
         bar = bar[:start] + label + bar[start + len(label):]
-    stdscr.addstr(bar)
-
-def find_current_index(lyrics: List[Line], t: float) -> int:
-    # Return index of the line that should be active at time t
-    lo, hi = 0, len(lyrics) - 1
-    ans = -1
-    while lo <= hi:
-        mid = (lo + hi) // 2
-        if lyrics[mid].t <= t:
-            ans = mid
-            lo = mid + 1
-        else:
-            hi = mid - 1
-    return ans
+    return bar
+
+def find_current_index(times: List[float], t: float) -> int:
+    # Return index of the line that should be active at time t.
+    # bisect_right is a C-level binary search over a flat list of floats, so
+    # there is no per-step attribute chase or interpreter loop here.
+    return bisect.bisect_right(times, t) - 1
+
+def advance_index(times: List[float], t: float, hint: int) -> int:
+    # Like find_current_index, but probes near the hinted (last) index first.
+    # Playback time moves monotonically, so the answer is almost always the
+    # hint itself or its successor; only seeks (offset nudges) fall through to
+    # the full binary search.
+    n = len(times)
+    if 0 <= hint < n and times[hint] <= t:
+        if hint + 1 >= n or t < times[hint + 1]:
+            return hint
+        if hint + 2 >= n or t < times[hint + 2]:
+            return hint + 1
+    elif hint < 0 and (n == 0 or t < times[0]):
+        return -1
+    return find_current_index(times, t)
 
 def estimate_total_duration(audio: str, fallback: float = 0.0) -> float:
     # We won't parse duration to avoid ffprobe dependency. Let user live without total length, or approximate from last lyric.
     return fallback
 
-def karaoke(stdscr, audio: str, lrc: str, offset: float, tempo: float, pitch: float):
+def estimate_ffplay_latency() -> float:
+    # Rough per-platform constant for ffplay's decode + audio-output latency.
+    # perf_counter starts at Popen return, not at the first audible sample, so
+    # without this the gap becomes a fixed bias the user has to nudge away.
+    if sys.platform == "darwin":   # CoreAudio
+        return 0.15
+    if sys.platform == "win32":    # WASAPI
+        return 0.40
+    return 0.25                    # ALSA/Pulse and friends
+
+def karaoke(stdscr, audio: str, lrc: str, offset: float, tempo: float, pitch: float, fps: float = 10.0, buffered: bool = False):
     curses.curs_set(0)
     stdscr.nodelay(True)
-    stdscr.timeout(50)  # 20 FPS
+    # getch blocks up to the timeout, so the loop needs no extra sleep. Lyric
+    # changes are sub-second events, so ~10 Hz is plenty; slow terminals can
+    # lower it further with --fps. The loop stretches this further between
+    # events (see the next_wake computation below).
+    base_ms = int(1000 / max(1.0, fps))
+    stdscr.timeout(base_ms)
 
-    lyrics = parse_lrc(lrc)
-    if not lyrics:
+    times, texts = parse_lrc(lrc)
+    if not times:
         raise SystemExit("No timestamped lyrics found in .lrc")
 
-    last_stamp = lyrics[-1].t
+    last_stamp = times[-1]
     approx_total = last_stamp + 5.0  # a bit of tail
 
-    # Prepare player
-    cmd = build_ffplay_cmd(audio, tempo, pitch)
+    # Prefer the libmpv backend when available: it reports the actual playback
+    # position, so lyrics can't drift from the audio clock over long songs.
+    # Pitch shifting still goes through the ffplay filter chain.
+    use_mpv = mpv is not None and abs(pitch) < 1e-6
+    player = None
+    if use_mpv:
+        try:
+            player = mpv.MPV(audio_display=False, ytdl=False)
+            if abs(tempo - 1.0) > 1e-6:
+                player.speed = tempo  # mpv keeps pitch constant by default
+            player.play(audio)
+        except Exception:
+            # Don't leak a live mpv instance (and its event thread) if play()
+            # failed after the handle was created.
+            if player is not None:
+                with contextlib.suppress(Exception):
+                    player.terminate()
+            use_mpv = False
+            player = None
+    mpv_started = False
 
-    # Launch audio
-    try:
-        player = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL)
-    except FileNotFoundError:
-        raise SystemExit("ffplay not found. Install FFmpeg and ensure 'ffplay' is in PATH.")
+    if not use_mpv:
+        if FFPLAY is None:
+            raise SystemExit("ffplay not found. Install FFmpeg and ensure 'ffplay' is in PATH.")
+
+        # Prepare player
+        cmd = build_ffplay_cmd(audio, tempo, pitch, buffered)
+
+        # Launch audio. Absolute executable path + close_fds=False keeps
+        # Popen on the cheap posix_spawn fast path (no fork() copy of the
+        # Python heap, no fd-table walk); ffplay inherits nothing sensitive.
+        player = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL, close_fds=False)
+
+    # The first audible sample lands ~latency seconds after Popen returns, so
+    # an uncorrected clock has lyrics leading the audio. Enlarging start
+    # delays the lyric clock by that amount to cancel it out. mpv needs no
+    # such guess: we read its clock directly.
+    start = time.perf_counter() + offset + (0.0 if use_mpv else estimate_ffplay_latency())
+    now = -offset
+
+    # Dirty-flag renderer state: remember what each row last showed and only
+    # touch rows whose content actually changed, instead of erase()+full redraw
+    # every frame (which flickers and hammers slow terminals).
+    h, w = stdscr.getmaxyx()
+
+    # All drawing goes to an off-screen pad; noutrefresh + doupdate flips it
+    # to the terminal in one go, so slow curses builds never show a
+    # half-painted frame. Keystrokes are still read from stdscr.
+    stdscr.refresh()
+    pad = curses.newpad(max(h, 200), max(w, 400))
+    bar_width = max(10, w - 1)
+
+    # Re-query the terminal size only when told it changed, instead of a
+    # getmaxyx call per frame. ncurses' own C-level SIGWINCH handler updates
+    # the internal size and queues KEY_RESIZE (waking getch immediately even
+    # mid-timeout), so watching for that key is sufficient — installing a
+    # Python handler over it would actually disable resize handling.
+    resized = False
+    drawn_rows = {}       # row -> last string sent to the terminal
+    lyric_rows = set()    # rows currently occupied by the lyric block
+    prev_offset = None    # forces a title draw on the first frame
+    prev_filled = -1
+    prev_secs = -1
+    active_idx = -2       # sentinel so the first frame draws the lyric block
+    cached_block = []     # last-built lyric window: truncated display lines
+    cached_bold = None    # index within cached_block of the bold current line
+    cached_key = (-2, -1)  # (active_idx, width) the cached block was built for
+    title_head = "Karaoke CLI  •  q:quit  ↑/↓: nudge offset  ±0.05s  •  offset="
+    title_tail = "  tempo={:.2f}×  pitch={:+.1f} st".format(tempo, pitch)
+
+    def put_row(y, text, bold=False):
+        # Diff against the previous frame; skip the write when unchanged.
+        text = text[:max(0, w - 1)]
+        if drawn_rows.get(y) == text:
+            return
+        pad.move(y, 0)
+        pad.clrtoeol()
+        if bold:
+            pad.attron(curses.A_BOLD)
+            pad.addstr(y, 0, text)
+            pad.attroff(curses.A_BOLD)
+        else:
+            pad.addstr(y, 0, text)
+        drawn_rows[y] = text
+
+    def draw_row_batch(rows):
+        # One addstr for a run of consecutive rows: embedded newlines advance
+        # the cursor to column 0 of the next line, so N rows cost one
+        # Python->curses transition instead of N.
+        if rows:
+            pad.addstr(rows[0][0], 0, "\n".join(r[1] for r in rows))
 
-    start = time.perf_counter() + offset
     # Main loop
-    active_idx = -1
     try:
         while True:
-            now = time.perf_counter() - start
-            # update active index
-            idx = find_current_index(lyrics, now)
+            if use_mpv:
+                pos = player.time_pos
+                if pos is not None:
+                    mpv_started = True
+                    now = pos - offset
+                # time_pos is None before the first frame and after EOF; keep
+                # the previous value so the UI doesn't jump backwards.
+            else:
+                now = time.perf_counter() - start
+            idx = advance_index(times, now, active_idx)
+
+            if resized:
+                resized = False
+                nh, nw = stdscr.getmaxyx()
+                if (nh, nw) != (h, w):
+                    # Resize invalidates everything: start from a clean slate.
+                    h, w = nh, nw
+                    bar_width = max(10, w - 1)
+                    if h > 200 or w > 400:
+                        pad.resize(max(h, 200), max(w, 400))
+                    pad.erase()
+                    drawn_rows.clear()
+                    lyric_rows.clear()
+                    prev_offset = None
+                    prev_filled = -1
+                    prev_secs = -1
+                    active_idx = -2
+
+            if offset != prev_offset:
+                # Only the offset field varies at runtime; the rest of the
+                # title is formatted once outside the loop.
+                put_row(0, title_head + "{:+.2f}s".format(offset) + title_tail)
+                prev_offset = offset
+
+            # Progress bar only moves when the filled width or mm:ss changes (~1 Hz).
+            frac = 0.0 if approx_total <= 0 else min(1.0, max(0.0, now / approx_total))
+            filled = int(frac * (bar_width - 2))
+            secs = int(max(0.0, now))
+            if filled != prev_filled or secs != prev_secs:
+                put_row(1, format_progress(max(0.0, now), approx_total, bar_width))
+                prev_filled = filled
+                prev_secs = secs
+
+            # Lyric block only moves when the active line changes.
             if idx != active_idx:
                 active_idx = idx
 
-            # Clear and draw
-            stdscr.erase()
-            h, w = stdscr.getmaxyx()
-
-            title = "Karaoke CLI  •  q:quit  ↑/↓: nudge offset  ±0.05s  •  offset={:+.2f}s  tempo={:.2f}×  pitch={:+.1f} st".format(offset, tempo, pitch)
-            stdscr.addstr(0, 0, title[:max(0, w-1)])
-            # progress bar line
-            stdscr.move(1, 0)
-            draw_progress(stdscr, max(0.0, now), approx_total, max(10, w-1))
-
-            # Determine which lines to show: prev, current, next (and maybe one more)
-            lines_to_show = []
-            for rel in (-2, -1, 0, 1, 2):
-                j = active_idx + rel
-                if 0 <= j < len(lyrics):
-                    prefix = "  "
-                    if rel == 0:
-                        prefix = "> "
-                    elif rel == -1:
-                        prefix = "· "
-                    elif rel == 1:
-                        prefix = "· "
-                    lines_to_show.append(prefix + lyrics[j].text)
-
-            # Center this block vertically
-            y_start = max(3, (h // 2) - len(lines_to_show) // 2)
-            for i, line in enumerate(lines_to_show):
-                y = y_start + i
-                if y >= h - 1:
-                    break
-                if line.startswith("> "):
-                    stdscr.attron(curses.A_BOLD)
-                    stdscr.addstr(y, 0, line[:max(0, w-1)])
-                    stdscr.attroff(curses.A_BOLD)
+                # The prefixed, width-truncated block depends only on the
+                # active index and the terminal width; reuse it when neither
+                # changed (e.g. a height-only resize).
+                key = (active_idx, w)
+                if key != cached_key:
+                    cached_block = []
+                    cached_bold = None  # position of the bold current line
+                    for rel in (-2, -1, 0, 1, 2):
+                        j = active_idx + rel
+                        if 0 <= j < len(texts):
+                            if rel == 0:
+                                cached_bold = len(cached_block)
+                            cached_block.append((PREFIXES[rel + 2] + texts[j])[:max(0, w - 1)])
+                    cached_key = key
+
+                # Center this block vertically
+                y_start = max(3, (h // 2) - len(cached_block) // 2)
+                rows = []
+                for i, line in enumerate(cached_block):
+                    y = y_start + i
+                    if y >= h - 1:
+                        break
+                    rows.append((y, line))
+                new_rows = {r[0] for r in rows}
+
+                # Clear every row the old or new block touches, then send the
+                # text in at most three batches: before-bold, the bold current
+                # line, after-bold. The bold position comes straight from the
+                # cache, so no per-redraw rescan for the "> " line.
+                for y in lyric_rows | new_rows:
+                    pad.move(y, 0)
+                    pad.clrtoeol()
+                    drawn_rows.pop(y, None)
+                bold_pos = cached_bold if cached_bold is not None and cached_bold < len(rows) else None
+                if bold_pos is None:
+                    draw_row_batch(rows)
                 else:
-                    stdscr.addstr(y, 0, line[:max(0, w-1)])
+                    draw_row_batch(rows[:bold_pos])
+                    pad.attron(curses.A_BOLD)
+                    draw_row_batch(rows[bold_pos:bold_pos + 1])
+                    pad.attroff(curses.A_BOLD)
+                    draw_row_batch(rows[bold_pos + 1:])
+                for y, line in rows:
+                    drawn_rows[y] = line
+                lyric_rows = new_rows
 
-            stdscr.refresh()
+            # Atomic flip: stage the visible slice of the pad, then update the
+            # physical screen once.
+            pad.noutrefresh(0, 0, 0, 0, h - 1, w - 1)
+            curses.doupdate()
+
+            # Nothing on screen moves until the next lyric or the next whole
+            # second of the clock, so block getch until whichever comes first
+            # (keys still wake it immediately). Drops the idle wake rate to
+            # ~1 Hz between lyrics.
+            j = active_idx + 1
+            next_lyric = times[j] if 0 <= j < len(times) else math.inf
+            next_wake = min(next_lyric, math.floor(now) + 1.0) - now
+            stdscr.timeout(max(base_ms, int(next_wake * 1000)))
 
             # Keyboard handling
             try:
@@ -191,25 +441,39 @@ def karaoke(stdscr, audio: str, lrc: str, offset: float, tempo: float, pitch: fl
             if ch != -1:
                 if ch in (ord('q'), 27):  # q or ESC
                     break
+                elif ch == curses.KEY_RESIZE:
+                    resized = True
                 elif ch == curses.KEY_UP:
+                    # Same sign convention as --offset: + delays lyrics.
                     offset += 0.05
-                    start -= 0.05
+                    if not use_mpv:
+                        start += 0.05
                 elif ch == curses.KEY_DOWN:
                     offset -= 0.05
-                    start += 0.05
+                    if not use_mpv:
+                        start -= 0.05
 
             # Exit if player finished and last lyric has passed
-            if player.poll() is not None and now > last_stamp + 1.0:
+            if use_mpv:
+                finished = mpv_started and player.time_pos is None
+            else:
+                finished = player.poll() is not None
+            if finished and now > last_stamp + 1.0:
                 break
-
-            time.sleep(0.02)
     finally:
         # Clean up player if still running
-        if player.poll() is None:
+        if use_mpv:
             with contextlib.suppress(Exception):
                 player.terminate()
-                time.sleep(0.2)
-                player.kill()
+        elif player.poll() is None:
+            with contextlib.suppress(Exception):
+                player.terminate()
+                try:
+                    # ffplay normally dies within milliseconds of SIGTERM, so
+                    # this returns immediately; only escalate on a hang.
+                    player.wait(timeout=0.2)
+                except subprocess.TimeoutExpired:
+                    player.kill()
 
 def main():
     ap = argparse.ArgumentParser(description="Command-line Karaoke")
@@ -218,6 +482,8 @@ def main():
     ap.add_argument("--offset", type=float, default=0.0, help="Starting sync offset in seconds (+ delays lyrics)")
     ap.add_argument("--tempo", type=float, default=1.0, help="Playback tempo multiplier (0.5–2.0 recommended)")
     ap.add_argument("--pitch", type=float, default=0.0, help="Pitch shift in semitones (±4 recommended)")
+    ap.add_argument("--fps", type=float, default=10.0, help="Max UI refresh rate in Hz (lower saves CPU on slow terminals)")
+    ap.add_argument("--buffered", action="store_true", help="Let ffplay probe/buffer normally (use if audio starts clipped)")
     args = ap.parse_args()
 
     # Basic checks
@@ -228,15 +494,15 @@ def main():
         print(f"LRC not found: {args.lrc}", file=sys.stderr)
         sys.exit(1)
 
-    # Windows: suggest windows-curses if needed
+    # No initscr()/endwin() pre-probe: that switched the terminal in and out
+    # of the alternate screen once just to detect a broken curses, which
+    # flickers. Let wrapper itself fail and explain then.
     try:
-        curses.initscr()
-        curses.endwin()
-    except Exception:
+        curses.wrapper(lambda scr: karaoke(scr, args.audio, args.lrc, args.offset, args.tempo, args.pitch, args.fps, args.buffered))
+    except curses.error as e:
+        print(f"Terminal init failed: {e}", file=sys.stderr)
         print("If you're on Windows, install 'windows-curses' (pip install windows-curses).", file=sys.stderr)
-
-    curses.wrapper(lambda scr: karaoke(scr, args.audio, args.lrc, args.offset, args.tempo, args.pitch))
+        sys.exit(1)
 
 if __name__ == "__main__":
-    import contextlib
     main()